@@ -9,11 +9,132 @@
 #include "WPA/Andersen.h"
 #include "AE/Core/AbstractState.h"
 #include <pybind11/operators.h>
+#include <limits>
 
 
 namespace py = pybind11;
 using namespace SVF;
 
+// Python-side sentinels for unbounded interval ends, so bounds can be
+// compared with plain ints instead of going through BoundedInt
+static constexpr int64_t IntervalNegInf = std::numeric_limits<int64_t>::min();
+static constexpr int64_t IntervalPosInf = std::numeric_limits<int64_t>::max();
+
+// Values of AbstractValue.kind
+static constexpr int AbsValKindInterval = 0;
+static constexpr int AbsValKindAddress = 1;
+static constexpr int AbsValKindBottom = 2;
+static constexpr int AbsValKindMixed = 3;
+
+static inline BoundedInt intToBound(int64_t val) {
+    if (val == IntervalNegInf)
+        return BoundedInt::minus_infinity();
+    if (val == IntervalPosInf)
+        return BoundedInt::plus_infinity();
+    return BoundedInt(val);
+}
+
+static inline int64_t boundToInt(const BoundedInt &b) {
+    if (b.is_minus_infinity())
+        return IntervalNegInf;
+    if (b.is_plus_infinity())
+        return IntervalPosInf;
+    return b.getIntNumeral();
+}
+
+// Identity and map sizes settle most convergence checks before the
+// per-entry comparison
+static inline bool stateEquals(const AbstractState &lhs, const AbstractState &rhs) {
+    if (&lhs == &rhs)
+        return true;
+    if (lhs.getVarToVal().size() != rhs.getVarToVal().size() ||
+        lhs.getLocToVal().size() != rhs.getLocToVal().size())
+        return false;
+    return lhs.equals(rhs);
+}
+
+// lhs >= rhs requires every key of rhs to be in lhs, so a larger rhs map
+// can be rejected by size before walking the entries; a state trivially
+// contains itself and an empty state is contained in anything
+static inline bool stateGeq(const AbstractState &lhs, const AbstractState &rhs) {
+    if (&lhs == &rhs || (rhs.getVarToVal().empty() && rhs.getLocToVal().empty()))
+        return true;
+    if (rhs.getVarToVal().size() > lhs.getVarToVal().size() ||
+        rhs.getLocToVal().size() > lhs.getLocToVal().size())
+        return false;
+    return lhs >= rhs;
+}
+
+// Predicate tables for branch refinement, built once instead of on every
+// isCmpBranchFeasible call
+static const Map<s32_t, s32_t>& reversePredicate() {
+    static const Map<s32_t, s32_t> table = {
+        {CmpStmt::Predicate::FCMP_OEQ, CmpStmt::Predicate::FCMP_ONE}, // == -> !=
+        {CmpStmt::Predicate::FCMP_UEQ, CmpStmt::Predicate::FCMP_UNE}, // == -> !=
+        {CmpStmt::Predicate::FCMP_OGT, CmpStmt::Predicate::FCMP_OLE}, // > -> <=
+        {CmpStmt::Predicate::FCMP_OGE, CmpStmt::Predicate::FCMP_OLT}, // >= -> <
+        {CmpStmt::Predicate::FCMP_OLT, CmpStmt::Predicate::FCMP_OGE}, // < -> >=
+        {CmpStmt::Predicate::FCMP_OLE, CmpStmt::Predicate::FCMP_OGT}, // <= -> >
+        {CmpStmt::Predicate::FCMP_ONE, CmpStmt::Predicate::FCMP_OEQ}, // != -> ==
+        {CmpStmt::Predicate::FCMP_UNE, CmpStmt::Predicate::FCMP_UEQ}, // != -> ==
+        {CmpStmt::Predicate::ICMP_EQ, CmpStmt::Predicate::ICMP_NE}, // == -> !=
+        {CmpStmt::Predicate::ICMP_NE, CmpStmt::Predicate::ICMP_EQ}, // != -> ==
+        {CmpStmt::Predicate::ICMP_UGT, CmpStmt::Predicate::ICMP_ULE}, // > -> <=
+        {CmpStmt::Predicate::ICMP_ULT, CmpStmt::Predicate::ICMP_UGE}, // < -> >=
+        {CmpStmt::Predicate::ICMP_UGE, CmpStmt::Predicate::ICMP_ULT}, // >= -> <
+        {CmpStmt::Predicate::ICMP_SGT, CmpStmt::Predicate::ICMP_SLE}, // > -> <=
+        {CmpStmt::Predicate::ICMP_SLT, CmpStmt::Predicate::ICMP_SGE}, // < -> >=
+        {CmpStmt::Predicate::ICMP_SGE, CmpStmt::Predicate::ICMP_SLT}, // >= -> <
+    };
+    return table;
+}
+
+static const Map<s32_t, s32_t>& switchLhsRhsPredicate() {
+    static const Map<s32_t, s32_t> table = {
+        {CmpStmt::Predicate::FCMP_OEQ, CmpStmt::Predicate::FCMP_OEQ}, // == -> ==
+        {CmpStmt::Predicate::FCMP_UEQ, CmpStmt::Predicate::FCMP_UEQ}, // == -> ==
+        {CmpStmt::Predicate::FCMP_OGT, CmpStmt::Predicate::FCMP_OLT}, // > -> <
+        {CmpStmt::Predicate::FCMP_OGE, CmpStmt::Predicate::FCMP_OLE}, // >= -> <=
+        {CmpStmt::Predicate::FCMP_OLT, CmpStmt::Predicate::FCMP_OGT}, // < -> >
+        {CmpStmt::Predicate::FCMP_OLE, CmpStmt::Predicate::FCMP_OGE}, // <= -> >=
+        {CmpStmt::Predicate::FCMP_ONE, CmpStmt::Predicate::FCMP_ONE}, // != -> !=
+        {CmpStmt::Predicate::FCMP_UNE, CmpStmt::Predicate::FCMP_UNE}, // != -> !=
+        {CmpStmt::Predicate::ICMP_EQ, CmpStmt::Predicate::ICMP_EQ}, // == -> ==
+        {CmpStmt::Predicate::ICMP_NE, CmpStmt::Predicate::ICMP_NE}, // != -> !=
+        {CmpStmt::Predicate::ICMP_UGT, CmpStmt::Predicate::ICMP_ULT}, // > -> <
+        {CmpStmt::Predicate::ICMP_ULT, CmpStmt::Predicate::ICMP_UGT}, // < -> >
+        {CmpStmt::Predicate::ICMP_UGE, CmpStmt::Predicate::ICMP_ULE}, // >= -> <=
+        {CmpStmt::Predicate::ICMP_SGT, CmpStmt::Predicate::ICMP_SLT}, // > -> <
+        {CmpStmt::Predicate::ICMP_SLT, CmpStmt::Predicate::ICMP_SGT}, // < -> >
+        {CmpStmt::Predicate::ICMP_SGE, CmpStmt::Predicate::ICMP_SLE}, // >= -> <=
+    };
+    return table;
+}
+
+// Predicates missing from a table map to 0, as operator[] lookups did before
+static inline s32_t lookupPredicate(const Map<s32_t, s32_t> &table, s32_t predicate) {
+    auto it = table.find(predicate);
+    return it == table.end() ? 0 : it->second;
+}
+
+// Register an in-place AbstractValue lattice op for AbstractValue, IntervalValue
+// and AddressValue operands, all funnelled through the same AbstractValue op
+template <typename Op>
+static void defAbsValLatticeOp(py::class_<AbstractValue> &cls, const char *name, Op op) {
+    cls.def(name, [op](AbstractValue &self, const AbstractValue &other) {
+            op(self, other);
+        }, py::arg("other"))
+        .def(name, [op](AbstractValue &self, const IntervalValue &ival) {
+            op(self, AbstractValue(ival));
+        }, py::arg("other"))
+        .def(name, [op](AbstractValue &self, const AddressValue &aval) {
+            op(self, AbstractValue(aval));
+        }, py::arg("other"));
+}
+
+// The abstract-domain classes below are created in large numbers during
+// analysis; they are deliberately bound without py::dynamic_attr(), so
+// instances carry no per-object __dict__ (the pybind11 analogue of __slots__)
 void bind_abstract_state(py::module& m) {
 
     py::class_<BoundedInt>(m, "BoundedInt")
@@ -77,15 +198,21 @@ void bind_abstract_state(py::module& m) {
             return new IntervalValue();
         }))
         .def(py::init([](int64_t val) {
-            return new IntervalValue(static_cast<s64_t>(val));
+            return new IntervalValue(intToBound(val), intToBound(val));
         }), py::arg("val"))
 
+        // Typed fast path for the common int/int case; BoundedInt (or mixed)
+        // arguments fail this overload and fall through to the generic one
+        .def(py::init([](int64_t lb, int64_t ub) {
+            return new IntervalValue(intToBound(lb), intToBound(ub));
+        }), py::arg("lb"), py::arg("ub"))
+
         .def(py::init([](py::object lb, py::object ub) {
             auto to_bounded_int = [](py::object obj) -> BoundedInt {
                 if (py::isinstance<BoundedInt>(obj)) {
                     return obj.cast<BoundedInt>();
                 } else if (py::isinstance<py::int_>(obj)) {
-                    return BoundedInt(obj.cast<int64_t>());
+                    return intToBound(obj.cast<int64_t>());
                 } else {
                     throw std::invalid_argument("Expected int or BoundedInt");
                 }
@@ -153,33 +280,84 @@ void bind_abstract_state(py::module& m) {
         .def("geq", &IntervalValue::geq)
         .def("set_to_bottom", &IntervalValue::set_to_bottom)
         .def("set_to_top", &IntervalValue::set_to_top)
+        // Overwrite in place, so a caller can recycle one instance across
+        // fixpoint rounds instead of allocating a new IntervalValue each time
+        .def("set_bounds", [](IntervalValue &self, int64_t lb, int64_t ub) {
+            self = IntervalValue(intToBound(lb), intToBound(ub));
+        }, py::arg("lb"), py::arg("ub"))
         .def("toString", &IntervalValue::toString)
         .def("lb", &IntervalValue::lb)
         .def("ub", &IntervalValue::ub)
+        // (lb, ub) as plain ints, with NEG_INF/POS_INF for unbounded ends
+        .def("bounds", [](const IntervalValue &self) {
+            return py::make_tuple(boundToInt(self.lb()), boundToInt(self.ub()));
+        })
 
         .def("join_with", &IntervalValue::join_with, py::arg("other"))
         .def("meet_with", &IntervalValue::meet_with, py::arg("other"))
         .def("widen_with", &IntervalValue::widen_with, py::arg("other"))
         .def("narrow_with", &IntervalValue::narrow_with, py::arg("other"))
 
+        // Non-mutating forms returning a new interval, so results can be cached
+        // by the caller (e.g. keyed on bounds()) without aliasing the operands
+        .def("join", [](const IntervalValue &self, const IntervalValue &other) {
+            IntervalValue res = self;
+            res.join_with(other);
+            return res;
+        }, py::arg("other"))
+        .def("meet", [](const IntervalValue &self, const IntervalValue &other) {
+            IntervalValue res = self;
+            res.meet_with(other);
+            return res;
+        }, py::arg("other"))
+        .def("widen", [](const IntervalValue &self, const IntervalValue &other) {
+            IntervalValue res = self;
+            res.widen_with(other);
+            return res;
+        }, py::arg("other"))
+        .def("narrow", [](const IntervalValue &self, const IntervalValue &other) {
+            IntervalValue res = self;
+            res.narrow_with(other);
+            return res;
+        }, py::arg("other"))
+
         // Class methods for top/bottom
         .def_static("top", &IntervalValue::top)
         .def_static("bottom", &IntervalValue::bottom)
+        // Fold a whole batch in one native call instead of one join_with per item
+        .def_static("join_all", [](const std::vector<IntervalValue> &ivs) {
+            IntervalValue res = IntervalValue::bottom();
+            for (const IntervalValue &iv : ivs)
+                res.join_with(iv);
+            return res;
+        }, py::arg("intervals"))
 
+        // Values are mutable, so shared instances cannot be interned; these let
+        // callers hand out one instance and copy only where they mutate
+        .def("__copy__", [](const IntervalValue &self) {
+            return IntervalValue(self);
+        })
+        .def("__deepcopy__", [](const IntervalValue &self, py::dict) {
+            return IntervalValue(self);
+        }, py::arg("memo"))
         // __repr__ for Python string representation
         .def("__repr__", [](const IntervalValue &iv) {
             return iv.toString();
         });
+    m.attr("IntervalValue").attr("NEG_INF") = py::int_(IntervalNegInf);
+    m.attr("IntervalValue").attr("POS_INF") = py::int_(IntervalPosInf);
 
     py::class_<AddressValue>(m, "AddressValue", "Address Value Set")
         .def(py::init<u32_t>(), py::arg("val"))
         .def(py::init<const Set<u32_t>&>(), py::arg("vals"))
     
+        // Identity first: fixpoint stability checks often compare a value
+        // against itself, which would otherwise walk the whole address set
         .def("__eq__", [](const AddressValue &self, const AddressValue &other) {
-            return self.equals(other);
+            return &self == &other || self.equals(other);
         })
         .def("__ne__", [](const AddressValue &self, const AddressValue &other) {
-            return !self.equals(other);
+            return &self != &other && !self.equals(other);
         })
     
         .def("__iter__", [](AddressValue &self) {
@@ -202,80 +380,145 @@ void bind_abstract_state(py::module& m) {
     
         .def("join_with", &AddressValue::join_with)
         .def("meet_with", &AddressValue::meet_with)
+        // Non-mutating join: copy the larger operand and insert only the
+        // smaller one, so joining a subset costs a copy and no set rebuild
+        .def("join", [](const AddressValue &self, const AddressValue &other) {
+            const AddressValue &big = self.size() >= other.size() ? self : other;
+            const AddressValue &small = &big == &self ? other : self;
+            AddressValue res = big;
+            for (u32_t addr : small)
+                res.insert(addr);
+            return res;
+        }, py::arg("other"))
+        // Non-mutating meet: walk the smaller operand and probe the larger one
+        .def("meet", [](const AddressValue &self, const AddressValue &other) {
+            const AddressValue &small = self.size() <= other.size() ? self : other;
+            const AddressValue &big = &small == &self ? other : self;
+            AddressValue res;
+            for (u32_t addr : small) {
+                if (big.contains(addr))
+                    res.insert(addr);
+            }
+            return res;
+        }, py::arg("other"))
         .def("hasIntersect", &AddressValue::hasIntersect)
     
         .def("getVals", &AddressValue::getVals, py::return_value_policy::reference_internal)
+        // Hashable snapshot of the address set, usable as a memoization key
+        .def("getFrozenVals", [](const AddressValue &self) {
+            py::set vals;
+            for (u32_t addr : self)
+                vals.add(py::int_(addr));
+            return py::frozenset(vals);
+        })
         .def("setVals", &AddressValue::setVals, py::arg("vals"))
     
         .def_static("getVirtualMemAddress", &AddressValue::getVirtualMemAddress, py::arg("idx"))
         .def_static("isVirtualMemAddress", &AddressValue::isVirtualMemAddress, py::arg("val"))
+        .def_static("getInternalID", &AddressValue::getInternalID, py::arg("idx"))
+        // Batched encode/decode: one native call per set instead of per address
+        .def_static("getVirtualMemAddresses", [](const std::vector<u32_t> &ids) {
+            std::vector<u32_t> addrs;
+            addrs.reserve(ids.size());
+            for (u32_t id : ids)
+                addrs.push_back(AddressValue::getVirtualMemAddress(id));
+            return addrs;
+        }, py::arg("ids"))
+        .def("getInternalIDs", [](const AddressValue &self) {
+            Set<u32_t> ids;
+            for (u32_t addr : self)
+                ids.insert(AddressValue::getInternalID(addr));
+            return ids;
+        })
     
         .def("__str__", [](const AddressValue &av) {
             return av.toString();
         })
+        .def("__copy__", [](const AddressValue &self) {
+            return AddressValue(self);
+        })
+        .def("__deepcopy__", [](const AddressValue &self, py::dict) {
+            return AddressValue(self);
+        }, py::arg("memo"))
         .def("__repr__", [](const AddressValue &av) {
             return "<AddressValue: " + av.toString() + ">";
         });
     
 
-    py::class_<AbstractValue>(m, "AbstractValue")
+    // Address tag masks, so per-address encode/decode can be written inline
+    // (addr | ADDRESS_MASK, addr & FLIPPED_ADDRESS_MASK) instead of per-call
+    m.attr("AddressValue").attr("ADDRESS_MASK") = py::int_(static_cast<u32_t>(AddressMask));
+    m.attr("AddressValue").attr("FLIPPED_ADDRESS_MASK") = py::int_(static_cast<u32_t>(FlippedAddressMask));
+
+    py::class_<AbstractValue> absVal(m, "AbstractValue");
+    absVal.attr("INTERVAL") = py::int_(AbsValKindInterval);
+    absVal.attr("ADDRESS") = py::int_(AbsValKindAddress);
+    absVal.attr("BOTTOM") = py::int_(AbsValKindBottom);
+    absVal.attr("MIXED") = py::int_(AbsValKindMixed);
+    absVal
         .def(py::init<>())
         .def(py::init<const IntervalValue&>())
         .def(py::init<const AddressValue&>())
         .def("isInterval", &AbstractValue::isInterval)
         .def("isAddr", &AbstractValue::isAddr)
-        .def("getInterval", py::overload_cast<>(&AbstractValue::getInterval, py::const_)) 
-        .def("getAddrs", py::overload_cast<>(&AbstractValue::getAddrs, py::const_))
-        .def("getInterval", py::overload_cast<>(&AbstractValue::getInterval), py::return_value_policy::reference)
-        .def("getAddrs", py::overload_cast<>(&AbstractValue::getAddrs), py::return_value_policy::reference)
-        .def("equals", &AbstractValue::equals)
-            // === join_with overloads ===
-        .def("join_with", [](AbstractValue &self, const AbstractValue &other) {
-            self.join_with(other);
-        })
-        .def("join_with", [](AbstractValue &self, const IntervalValue &ival) {
-            self.join_with(AbstractValue(ival));
-        })
-        .def("join_with", [](AbstractValue &self, const AddressValue &aval) {
-            self.join_with(AbstractValue(aval));
-        })
-
-        // === meet_with overloads ===
-        .def("meet_with", [](AbstractValue &self, const AbstractValue &other) {
-            self.meet_with(other);
+        // Property forms skip creating a bound method object per check
+        .def_property_readonly("is_interval", &AbstractValue::isInterval)
+        .def_property_readonly("is_addr", &AbstractValue::isAddr)
+        // Single integer tag (INTERVAL/ADDRESS/MIXED/BOTTOM) for callers that
+        // dispatch on the kind, in place of chained isInterval()/isAddr() calls.
+        // MIXED marks a value holding both a non-bottom interval and addresses
+        .def_property_readonly("kind", [](const AbstractValue &self) {
+            if (self.isInterval())
+                return self.isAddr() ? AbsValKindMixed : AbsValKindInterval;
+            if (self.isAddr())
+                return AbsValKindAddress;
+            return AbsValKindBottom;
         })
-        .def("meet_with", [](AbstractValue &self, const IntervalValue &ival) {
-            self.meet_with(AbstractValue(ival));
+        // Canonical hashable key (lb, ub, frozenset(addrs)) for caches (e.g. of
+        // solver results) keyed on abstract values. Both parts are always
+        // included, since a value can carry an interval and addresses at once
+        .def("canonicalKey", [](const AbstractValue &self) {
+            const IntervalValue &iv = self.getInterval();
+            py::set vals;
+            for (u32_t addr : self.getAddrs())
+                vals.add(py::int_(addr));
+            return py::make_tuple(boundToInt(iv.lb()), boundToInt(iv.ub()), py::frozenset(vals));
         })
-        .def("meet_with", [](AbstractValue &self, const AddressValue &aval) {
-            self.meet_with(AbstractValue(aval));
+        // Bottom check without materialising the payload on the Python side,
+        // e.g. to drop entries that a meet has emptied
+        .def("isBottom", [](const AbstractValue &self) {
+            return !self.isInterval() && !self.isAddr();
         })
+        // Return the wrapped value in place; a const overload registered first
+        // would shadow these and copy the interval/address set on every access.
+        // Mutating the result therefore mutates this value (see pysvf.pyi)
+        .def("getInterval", py::overload_cast<>(&AbstractValue::getInterval), py::return_value_policy::reference_internal)
+        .def("getAddrs", py::overload_cast<>(&AbstractValue::getAddrs), py::return_value_policy::reference_internal)
+        .def("equals", &AbstractValue::equals);
 
-        // === widen_with overloads ===
-        .def("widen_with", [](AbstractValue &self, const AbstractValue &other) {
-            self.widen_with(other);
-        })
-        .def("widen_with", [](AbstractValue &self, const IntervalValue &ival) {
-            self.widen_with(AbstractValue(ival));
-        })
-        .def("widen_with", [](AbstractValue &self, const AddressValue &aval) {
-            self.widen_with(AbstractValue(aval));
-        })
-
-        // === narrow_with overloads ===
-        .def("narrow_with", [](AbstractValue &self, const AbstractValue &other) {
-            self.narrow_with(other);
-        })
-        .def("narrow_with", [](AbstractValue &self, const IntervalValue &ival) {
-            self.narrow_with(AbstractValue(ival));
-        })
-        .def("narrow_with", [](AbstractValue &self, const AddressValue &aval) {
-            self.narrow_with(AbstractValue(aval));
-        })
+    defAbsValLatticeOp(absVal, "join_with", [](AbstractValue &self, const AbstractValue &other) {
+        self.join_with(other);
+    });
+    defAbsValLatticeOp(absVal, "meet_with", [](AbstractValue &self, const AbstractValue &other) {
+        self.meet_with(other);
+    });
+    defAbsValLatticeOp(absVal, "widen_with", [](AbstractValue &self, const AbstractValue &other) {
+        self.widen_with(other);
+    });
+    defAbsValLatticeOp(absVal, "narrow_with", [](AbstractValue &self, const AbstractValue &other) {
+        self.narrow_with(other);
+    });
 
+    absVal
         .def("__eq__", [](const AbstractValue& a, const AbstractValue& b) {
-            return a.equals(b);
+            return &a == &b || a.equals(b);
+        })
+        .def("__copy__", [](const AbstractValue &self) {
+            return AbstractValue(self);
         })
+        .def("__deepcopy__", [](const AbstractValue &self, py::dict) {
+            return AbstractValue(self);
+        }, py::arg("memo"))
         .def("__str__", &AbstractValue::toString);
 
     py::class_<AbstractState>(m, "AbstractState")
@@ -306,15 +549,30 @@ void bind_abstract_state(py::module& m) {
             py::arg("varId"), py::return_value_policy::reference)
     
         // Equality comparison
-        .def("equals", &AbstractState::equals,
-             py::arg("other"))
+        .def("equals", [](const AbstractState& self, const AbstractState& other) {
+            return stateEquals(self, other);
+        }, py::arg("other"))
 
-        .def("__eq__", [](AbstractState& self, AbstractState& other) {
-            return self.operator==(other);
+        .def("__eq__", [](const AbstractState& self, const AbstractState& other) {
+            return stateEquals(self, other);
         }, py::arg("other"))
 
-        .def("__ne__", [](AbstractState& self, AbstractState& other) {
-            return self.operator!=(other);
+        .def("__ne__", [](const AbstractState& self, const AbstractState& other) {
+            return !stateEquals(self, other);
+        }, py::arg("other"))
+
+        // Structural hash (over the variable/location key sets). States stay
+        // mutable, so this is a method rather than __hash__: callers memoizing
+        // transfer results bucket by hash() and confirm with equals()
+        .def("hash", &AbstractState::hash)
+
+        // Lattice order (per-key containment), evaluated natively instead of
+        // walking both maps from Python with IntervalValue.contain
+        .def("__ge__", [](const AbstractState& self, const AbstractState& other) {
+            return stateGeq(self, other);
+        }, py::arg("other"))
+        .def("__le__", [](const AbstractState& self, const AbstractState& other) {
+            return stateGeq(other, self);
         }, py::arg("other"))
     
         // Abstract operations
@@ -339,19 +597,39 @@ void bind_abstract_state(py::module& m) {
         .def("__getitem__", [](AbstractState& self, u32_t varId) -> AbstractValue& {
             return self[varId];
         }, py::arg("varId"), py::return_value_policy::reference)
+
+        // Non-inserting lookup: unlike __getitem__, a miss leaves the state
+        // unchanged. As with dict.get, a hit returns the stored value itself
+        // (mutating it updates the state), while a miss returns `default` when
+        // given, else a new top value that is not part of the state. Hits are
+        // tested on the map, not inVarToValTable, which only counts intervals
+        .def("get", [](py::object pySelf, u32_t varId, py::object defaultVal) -> py::object {
+            AbstractState& self = pySelf.cast<AbstractState&>();
+            if (self.getVarToVal().find(varId) != self.getVarToVal().end()) {
+                return py::cast(&self[varId], py::return_value_policy::reference_internal, pySelf);
+            }
+            // Only reached for absent keys, so a caller's sentinel default
+            // never hides a stored address-only value
+            if (!defaultVal.is_none())
+                return defaultVal;
+            return py::cast(AbstractValue());
+        }, py::arg("var_id"), py::arg("default") = py::none())
     
         .def("__setitem__", [](AbstractState& self, u32_t varId, py::object val) {
+            // Cast to references so the held C++ value is copied once, straight
+            // into the state, rather than into a temporary first
             if (py::isinstance<AbstractValue>(val)) {
-                self[varId] = val.cast<AbstractValue>();
+                self[varId] = val.cast<const AbstractValue&>();
             }
             else if (py::isinstance<IntervalValue>(val)) {
-                self[varId] = AbstractValue(val.cast<IntervalValue>());
+                self[varId] = AbstractValue(val.cast<const IntervalValue&>());
             }
             else if (py::isinstance<AddressValue>(val)) {
-                self[varId] = AbstractValue(val.cast<AddressValue>());
+                self[varId] = AbstractValue(val.cast<const AddressValue&>());
             }
             else if (py::isinstance<py::int_>(val)) {
-                self[varId] = AbstractValue(IntervalValue(val.cast<s64_t>()));
+                BoundedInt b = intToBound(val.cast<int64_t>());
+                self[varId] = AbstractValue(IntervalValue(b, b));
             }
             else {
                 throw std::invalid_argument("Unsupported type for AbstractState assignment.");
@@ -361,13 +639,102 @@ void bind_abstract_state(py::module& m) {
         // Access to internal maps
         .def("getVarToVal", &AbstractState::getVarToVal, py::return_value_policy::reference)
         .def("getLocToVal", &AbstractState::getLocToVal, py::return_value_policy::reference)
+        // Key sets only, for set algebra over states without converting
+        // (and copying) every stored AbstractValue into a dict
+        .def("getVarIDs", [](const AbstractState& self) {
+            py::set ids;
+            for (const auto& item : self.getVarToVal())
+                ids.add(py::int_(item.first));
+            return ids;
+        })
+        .def("getLocIDs", [](const AbstractState& self) {
+            py::set ids;
+            for (const auto& item : self.getLocToVal())
+                ids.add(py::int_(item.first));
+            return ids;
+        })
+        // Wrapper-free counterparts of getVarToVal/__setitem__: address entries
+        // as frozensets, and interval stores straight from (lb, ub) ints
+        .def("getVarAddrSets", [](const AbstractState& self) {
+            py::dict res;
+            for (const auto& item : self.getVarToVal()) {
+                if (!item.second.isAddr())
+                    continue;
+                py::set vals;
+                for (u32_t addr : item.second.getAddrs())
+                    vals.add(py::int_(addr));
+                res[py::int_(item.first)] = py::frozenset(vals);
+            }
+            return res;
+        })
+        .def("setVarInterval", [](AbstractState& self, u32_t varId, int64_t lb, int64_t ub) {
+            self[varId] = AbstractValue(IntervalValue(intToBound(lb), intToBound(ub)));
+        }, py::arg("varId"), py::arg("lb"), py::arg("ub"))
+        // Plain interval entries as parallel columns (ids, lbs, ubs) with
+        // NEG_INF/POS_INF for unbounded ends, ready for np.asarray(..., dtype=np.int64).
+        // MIXED entries (interval plus addresses) are left out, as the columns
+        // cannot carry their address part
+        .def("getVarIntervalBounds", [](const AbstractState& self) {
+            std::vector<u32_t> ids;
+            std::vector<int64_t> lbs, ubs;
+            ids.reserve(self.getVarToVal().size());
+            lbs.reserve(self.getVarToVal().size());
+            ubs.reserve(self.getVarToVal().size());
+            for (const auto& item : self.getVarToVal()) {
+                if (!item.second.isInterval() || item.second.isAddr())
+                    continue;
+                const IntervalValue& iv = item.second.getInterval();
+                ids.push_back(item.first);
+                lbs.push_back(boundToInt(iv.lb()));
+                ubs.push_back(boundToInt(iv.ub()));
+            }
+            return py::make_tuple(ids, lbs, ubs);
+        })
+        // Inverse of getVarIntervalBounds: store parallel columns back in one
+        // call, e.g. after a vectorised np.minimum/np.maximum join. Only the
+        // interval part is overwritten; any address set is kept
+        .def("setVarIntervalBounds", [](AbstractState& self, const std::vector<u32_t>& ids,
+                                        const std::vector<int64_t>& lbs, const std::vector<int64_t>& ubs) {
+            if (ids.size() != lbs.size() || ids.size() != ubs.size())
+                throw std::invalid_argument("ids, lbs and ubs must have the same length");
+            for (size_t i = 0; i < ids.size(); ++i)
+                self[ids[i]].getInterval() = IntervalValue(intToBound(lbs[i]), intToBound(ubs[i]));
+        }, py::arg("ids"), py::arg("lbs"), py::arg("ubs"))
         .def("printAbstractState", &AbstractState::printAbstractState)
-        .def("clone", [](AbstractState& self) {
-            return new AbstractState(self);
-        }, py::return_value_policy::reference)
+        // Returned by value so Python owns (and frees) the copy; with a raw
+        // pointer under the reference policy every clone leaked a full state
+        .def("clone", [](const AbstractState& self) {
+            return AbstractState(self);
+        })
+        .def("__copy__", [](const AbstractState& self) {
+            return AbstractState(self);
+        })
+        .def("__deepcopy__", [](const AbstractState& self, py::dict) {
+            return AbstractState(self);
+        }, py::arg("memo"))
+        // Copy only the ids present in this state; unlike the C++ sliceState this
+        // does not insert (and copy) a top entry for every missing id. Probes
+        // go from the smaller of ids and the state into the larger one
+        .def("sliceState", [](const AbstractState& self, const Set<u32_t>& ids) {
+            AbstractState inv;
+            const auto& varToVal = self.getVarToVal();
+            if (ids.size() <= varToVal.size()) {
+                for (u32_t id : ids) {
+                    auto it = varToVal.find(id);
+                    if (it != varToVal.end())
+                        inv[id] = it->second;
+                }
+            }
+            else {
+                for (const auto& item : varToVal) {
+                    if (ids.count(item.first))
+                        inv[item.first] = item.second;
+                }
+            }
+            return inv;
+        }, py::arg("ids"))
         .def("bottom", &AbstractState::bottom)
         .def("top", &AbstractState::top)
-        .def("getGepObjAddrs", &AbstractState::getGepObjAddrs, py::arg("ptr"), py::arg("offset"))
         .def("getElementIndex", &AbstractState::getElementIndex, py::arg("gep"))
         .def("getByteOffset", &AbstractState::getByteOffset, py::arg("gep"))
         .def("loadValue", &AbstractState::loadValue, py::arg("var_id"))
@@ -376,45 +743,12 @@ void bind_abstract_state(py::module& m) {
         .def("inVarToValTable", &AbstractState::inVarToValTable, py::arg("var_id"))
         .def("inVarToAddrsTable", &AbstractState::inVarToAddrsTable, py::arg("var_id"))
         .def("getGepObjAddrs", &AbstractState::getGepObjAddrs, py::arg("var_id"), py::arg("offset"))
+        // Constant-offset form: callers with a known field index skip building
+        // a Python IntervalValue(c, c) just to pass it in
+        .def("getGepObjAddrs", [](AbstractState& self, u32_t varId, int64_t offset) {
+            return self.getGepObjAddrs(varId, IntervalValue(intToBound(offset), intToBound(offset)));
+        }, py::arg("var_id"), py::arg("offset"))
         .def_static("isCmpBranchFeasible", [](SVFIR* svfir, const CmpStmt* cmpStmt, s64_t succ, AbstractState& as) {
-            Map<s32_t, s32_t> _reverse_predicate = {
-                {CmpStmt::Predicate::FCMP_OEQ, CmpStmt::Predicate::FCMP_ONE}, // == -> !=
-                {CmpStmt::Predicate::FCMP_UEQ, CmpStmt::Predicate::FCMP_UNE}, // == -> !=
-                {CmpStmt::Predicate::FCMP_OGT, CmpStmt::Predicate::FCMP_OLE}, // > -> <=
-                {CmpStmt::Predicate::FCMP_OGE, CmpStmt::Predicate::FCMP_OLT}, // >= -> <
-                {CmpStmt::Predicate::FCMP_OLT, CmpStmt::Predicate::FCMP_OGE}, // < -> >=
-                {CmpStmt::Predicate::FCMP_OLE, CmpStmt::Predicate::FCMP_OGT}, // <= -> >
-                {CmpStmt::Predicate::FCMP_ONE, CmpStmt::Predicate::FCMP_OEQ}, // != -> ==
-                {CmpStmt::Predicate::FCMP_UNE, CmpStmt::Predicate::FCMP_UEQ}, // != -> ==
-                {CmpStmt::Predicate::ICMP_EQ, CmpStmt::Predicate::ICMP_NE}, // == -> !=
-                {CmpStmt::Predicate::ICMP_NE, CmpStmt::Predicate::ICMP_EQ}, // != -> ==
-                {CmpStmt::Predicate::ICMP_UGT, CmpStmt::Predicate::ICMP_ULE}, // > -> <=
-                {CmpStmt::Predicate::ICMP_ULT, CmpStmt::Predicate::ICMP_UGE}, // < -> >=
-                {CmpStmt::Predicate::ICMP_UGE, CmpStmt::Predicate::ICMP_ULT}, // >= -> <
-                {CmpStmt::Predicate::ICMP_SGT, CmpStmt::Predicate::ICMP_SLE}, // > -> <=
-                {CmpStmt::Predicate::ICMP_SLT, CmpStmt::Predicate::ICMP_SGE}, // < -> >=
-                {CmpStmt::Predicate::ICMP_SGE, CmpStmt::Predicate::ICMP_SLT}, // >= -> <
-            };
-            
-            Map<s32_t, s32_t> _switch_lhsrhs_predicate = {
-                {CmpStmt::Predicate::FCMP_OEQ, CmpStmt::Predicate::FCMP_OEQ}, // == -> ==
-                {CmpStmt::Predicate::FCMP_UEQ, CmpStmt::Predicate::FCMP_UEQ}, // == -> ==
-                {CmpStmt::Predicate::FCMP_OGT, CmpStmt::Predicate::FCMP_OLT}, // > -> <
-                {CmpStmt::Predicate::FCMP_OGE, CmpStmt::Predicate::FCMP_OLE}, // >= -> <=
-                {CmpStmt::Predicate::FCMP_OLT, CmpStmt::Predicate::FCMP_OGT}, // < -> >
-                {CmpStmt::Predicate::FCMP_OLE, CmpStmt::Predicate::FCMP_OGE}, // <= -> >=
-                {CmpStmt::Predicate::FCMP_ONE, CmpStmt::Predicate::FCMP_ONE}, // != -> !=
-                {CmpStmt::Predicate::FCMP_UNE, CmpStmt::Predicate::FCMP_UNE}, // != -> !=
-                {CmpStmt::Predicate::ICMP_EQ, CmpStmt::Predicate::ICMP_EQ}, // == -> ==
-                {CmpStmt::Predicate::ICMP_NE, CmpStmt::Predicate::ICMP_NE}, // != -> !=
-                {CmpStmt::Predicate::ICMP_UGT, CmpStmt::Predicate::ICMP_ULT}, // > -> <
-                {CmpStmt::Predicate::ICMP_ULT, CmpStmt::Predicate::ICMP_UGT}, // < -> >
-                {CmpStmt::Predicate::ICMP_UGE, CmpStmt::Predicate::ICMP_ULE}, // >= -> <=
-                {CmpStmt::Predicate::ICMP_SGT, CmpStmt::Predicate::ICMP_SLT}, // > -> <
-                {CmpStmt::Predicate::ICMP_SLT, CmpStmt::Predicate::ICMP_SGT}, // < -> >
-                {CmpStmt::Predicate::ICMP_SGE, CmpStmt::Predicate::ICMP_SLE}, // >= -> <=
-            };
-            
             AbstractState new_es = as;
             // get cmp stmt's op0, op1, and predicate
             NodeID op0 = cmpStmt->getOpVarID(0);
@@ -465,7 +799,7 @@ void bind_abstract_state(py::module& m) {
             if (b0 && !b1) {
                 std::swap(op0, op1);
                 std::swap(load_op0, load_op1);
-                predicate = _switch_lhsrhs_predicate[predicate];
+                predicate = lookupPredicate(switchLhsRhsPredicate(), predicate);
             }
             else {
                 // if var X var, we cannot preset the branch condition to infer the intervals of var0,var1
@@ -482,7 +816,7 @@ void bind_abstract_state(py::module& m) {
             // if cmp is 'var X const == false', we should reverse predicate 'var X' const == true'
             // X' is reverse predicate of X
             if (succ == 0) {
-                predicate = _reverse_predicate[predicate];
+                predicate = lookupPredicate(reversePredicate(), predicate);
             }
             else {
             }
@@ -598,44 +932,6 @@ void bind_abstract_state(py::module& m) {
             return true;
         }, py::arg("pag"), py::arg("cmpStmt"), py::arg("succ"), py::arg("as"))
         .def_static("isSwitchBranchFeasible", [](SVFIR* svfir, const SVFVar* var, s64_t succ, AbstractState& as) {
-            Map<s32_t, s32_t> _reverse_predicate = {
-                {CmpStmt::Predicate::FCMP_OEQ, CmpStmt::Predicate::FCMP_ONE}, // == -> !=
-                {CmpStmt::Predicate::FCMP_UEQ, CmpStmt::Predicate::FCMP_UNE}, // == -> !=
-                {CmpStmt::Predicate::FCMP_OGT, CmpStmt::Predicate::FCMP_OLE}, // > -> <=
-                {CmpStmt::Predicate::FCMP_OGE, CmpStmt::Predicate::FCMP_OLT}, // >= -> <
-                {CmpStmt::Predicate::FCMP_OLT, CmpStmt::Predicate::FCMP_OGE}, // < -> >=
-                {CmpStmt::Predicate::FCMP_OLE, CmpStmt::Predicate::FCMP_OGT}, // <= -> >
-                {CmpStmt::Predicate::FCMP_ONE, CmpStmt::Predicate::FCMP_OEQ}, // != -> ==
-                {CmpStmt::Predicate::FCMP_UNE, CmpStmt::Predicate::FCMP_UEQ}, // != -> ==
-                {CmpStmt::Predicate::ICMP_EQ, CmpStmt::Predicate::ICMP_NE}, // == -> !=
-                {CmpStmt::Predicate::ICMP_NE, CmpStmt::Predicate::ICMP_EQ}, // != -> ==
-                {CmpStmt::Predicate::ICMP_UGT, CmpStmt::Predicate::ICMP_ULE}, // > -> <=
-                {CmpStmt::Predicate::ICMP_ULT, CmpStmt::Predicate::ICMP_UGE}, // < -> >=
-                {CmpStmt::Predicate::ICMP_UGE, CmpStmt::Predicate::ICMP_ULT}, // >= -> <
-                {CmpStmt::Predicate::ICMP_SGT, CmpStmt::Predicate::ICMP_SLE}, // > -> <=
-                {CmpStmt::Predicate::ICMP_SLT, CmpStmt::Predicate::ICMP_SGE}, // < -> >=
-                {CmpStmt::Predicate::ICMP_SGE, CmpStmt::Predicate::ICMP_SLT}, // >= -> <
-            };
-            
-            Map<s32_t, s32_t> _switch_lhsrhs_predicate = {
-                {CmpStmt::Predicate::FCMP_OEQ, CmpStmt::Predicate::FCMP_OEQ}, // == -> ==
-                {CmpStmt::Predicate::FCMP_UEQ, CmpStmt::Predicate::FCMP_UEQ}, // == -> ==
-                {CmpStmt::Predicate::FCMP_OGT, CmpStmt::Predicate::FCMP_OLT}, // > -> <
-                {CmpStmt::Predicate::FCMP_OGE, CmpStmt::Predicate::FCMP_OLE}, // >= -> <=
-                {CmpStmt::Predicate::FCMP_OLT, CmpStmt::Predicate::FCMP_OGT}, // < -> >
-                {CmpStmt::Predicate::FCMP_OLE, CmpStmt::Predicate::FCMP_OGE}, // <= -> >=
-                {CmpStmt::Predicate::FCMP_ONE, CmpStmt::Predicate::FCMP_ONE}, // != -> !=
-                {CmpStmt::Predicate::FCMP_UNE, CmpStmt::Predicate::FCMP_UNE}, // != -> !=
-                {CmpStmt::Predicate::ICMP_EQ, CmpStmt::Predicate::ICMP_EQ}, // == -> ==
-                {CmpStmt::Predicate::ICMP_NE, CmpStmt::Predicate::ICMP_NE}, // != -> !=
-                {CmpStmt::Predicate::ICMP_UGT, CmpStmt::Predicate::ICMP_ULT}, // > -> <
-                {CmpStmt::Predicate::ICMP_ULT, CmpStmt::Predicate::ICMP_UGT}, // < -> >
-                {CmpStmt::Predicate::ICMP_UGE, CmpStmt::Predicate::ICMP_ULE}, // >= -> <=
-                {CmpStmt::Predicate::ICMP_SGT, CmpStmt::Predicate::ICMP_SLT}, // > -> <
-                {CmpStmt::Predicate::ICMP_SLT, CmpStmt::Predicate::ICMP_SGT}, // < -> >
-                {CmpStmt::Predicate::ICMP_SGE, CmpStmt::Predicate::ICMP_SLE}, // >= -> <=
-            };
-            
             AbstractState new_es = as;
             IntervalValue& switch_cond = new_es[var->getId()].getInterval();
             s64_t value = succ;
@@ -1,4 +1,4 @@
-from typing import List, Iterator, Tuple, Any
+from typing import List, Iterator, Tuple, Any, Set, FrozenSet, Dict
 from typing import overload, Optional, Union
 from typing import TYPE_CHECKING
 
@@ -1778,6 +1778,8 @@ class BoundedInt:
 
 
 class IntervalValue:
+    NEG_INF: int
+    POS_INF: int
     @overload
     def __init__(self, lb: int, ub: int) -> None: ...
     @overload
@@ -1799,12 +1801,18 @@ class IntervalValue:
     def __lshift__(self, bits: int) -> "IntervalValue": ...
     def __rshift__(self, bits: int) -> "IntervalValue": ...
     def equals(self, other: "IntervalValue") -> "IntervalValue": ...
-    def lb(self) -> int: ...
-    def ub(self) -> int: ...
+    def lb(self) -> BoundedInt: ...
+    def ub(self) -> BoundedInt: ...
+    # plain ints; unbounded ends are NEG_INF / POS_INF, bottom has lb > ub
+    def bounds(self) -> Tuple[int, int]: ...
     def join_with(self, other: 'IntervalValue') -> None: ...
     def meet_with(self, other: 'IntervalValue') -> None: ...
     def widen_with(self, other: 'IntervalValue') -> None: ...
     def narrow_with(self, other: 'IntervalValue') -> None: ...
+    def join(self, other: 'IntervalValue') -> 'IntervalValue': ...
+    def meet(self, other: 'IntervalValue') -> 'IntervalValue': ...
+    def widen(self, other: 'IntervalValue') -> 'IntervalValue': ...
+    def narrow(self, other: 'IntervalValue') -> 'IntervalValue': ...
     def isBottom(self) -> bool: ...
     def isTop(self) -> bool: ...
     def is_numeral(self) -> bool: ...
@@ -1820,17 +1828,24 @@ class IntervalValue:
     def geq(self, other: 'IntervalValue') -> bool: ...
     def set_to_bottom(self) -> None: ...
     def set_to_top(self) -> None: ...
+    def set_bounds(self, lb: int, ub: int) -> None: ...
     def toString(self) -> str: ...
     def eq_interval(self, other: 'IntervalValue') -> 'IntervalValue': ...
     def ne_interval(self, other: 'IntervalValue') -> 'IntervalValue': ...
+    def __copy__(self) -> 'IntervalValue': ...
+    def __deepcopy__(self, memo: dict) -> 'IntervalValue': ...
     @staticmethod
     def top() -> 'IntervalValue': ...
     @staticmethod
     def bottom() -> 'IntervalValue': ...
+    @staticmethod
+    def join_all(intervals: List['IntervalValue']) -> 'IntervalValue': ...
     def __repr__(self) -> str: ...
 
 
 class AddressValue:
+    ADDRESS_MASK: int
+    FLIPPED_ADDRESS_MASK: int
     @overload
     def __init__(self, val: int) -> None: ...
     @overload
@@ -1844,26 +1859,51 @@ class AddressValue:
     def isBottom(self) -> bool: ...
     def join_with(self, other: 'AddressValue') -> bool: ...
     def meet_with(self, other: 'AddressValue') -> bool: ...
+    def join(self, other: 'AddressValue') -> 'AddressValue': ...
+    def meet(self, other: 'AddressValue') -> 'AddressValue': ...
     def hasIntersect(self, other: 'AddressValue') -> bool: ...
     def getVals(self) -> Set[int]: ...
+    def getFrozenVals(self) -> FrozenSet[int]: ...
     def setVals(self, vals: Set[int]) -> None: ...
     def __contains__(self, addr: int) -> bool: ...
     def __iter__(self): ...
     def __len__(self) -> int: ...
+    def __copy__(self) -> 'AddressValue': ...
+    def __deepcopy__(self, memo: dict) -> 'AddressValue': ...
     def __repr__(self) -> str: ...
     @staticmethod
     def getVirtualMemAddress(idx: int) -> int: ...
     @staticmethod
     def isVirtualMemAddress(val: int) -> bool: ...
+    @staticmethod
+    def getInternalID(idx: int) -> int: ...
+    @staticmethod
+    def getVirtualMemAddresses(ids: List[int]) -> List[int]: ...
+    def getInternalIDs(self) -> Set[int]: ...
 
 
 class AbstractValue:
+    INTERVAL: int
+    ADDRESS: int
+    BOTTOM: int
+    MIXED: int
     @overload
     def __init__(self, val: int) -> None: ...
     @overload
     def __init__(self, vals: Set[int]) -> None: ...
     def isInterval(self) -> bool: ...
     def isAddr(self) -> bool: ...
+    def isBottom(self) -> bool: ...
+    @property
+    def is_interval(self) -> bool: ...
+    @property
+    def is_addr(self) -> bool: ...
+    @property
+    def kind(self) -> int: ...
+    def canonicalKey(self) -> Tuple[int, int, FrozenSet[int]]: ...
+    # getInterval/getAddrs return the held value itself, not a copy: mutating
+    # the result (e.g. meet_with) changes this AbstractValue, and so the state
+    # it came from; use copy.copy() for a detached value
     def getInterval(self) -> IntervalValue: ...
     def getAddrs(self) -> AddressValue: ...
     def equals(self, other: 'AbstractValue') -> bool: ...
@@ -1873,6 +1913,8 @@ class AbstractValue:
     def narrow_with(self, other: 'AbstractValue') -> None: ...
     # def refAddrs(self) -> list: ...
     # def refInterval(self) -> "IntervalValue": ...
+    def __copy__(self) -> 'AbstractValue': ...
+    def __deepcopy__(self, memo: dict) -> 'AbstractValue': ...
     def __eq__(self, other: object) -> bool: ...
     def __str__(self) -> str: ...
 
@@ -1882,15 +1924,22 @@ class AbstractState:
     def getVar(self, var_id: int) -> AbstractValue: ...
     def setVar(self, var_id: int, val: AbstractValue) -> None: ...
     def __getitem__(self, var_id: int) -> AbstractValue: ...
+    # any stored entry (interval, address or bottom) is a hit and is returned
+    # live; `default` (else a fresh top) only stands for an absent var_id
+    def get(self, var_id: int, default: Optional[AbstractValue] = None) -> AbstractValue: ...
     def __setitem__(self, var_id: int, val: AbstractValue) -> None: ...
     def store(self, addr: int, val: AbstractValue) -> None: ...
     def load(self, addr: int) -> AbstractValue: ...
     def equals(self, other: 'AbstractState') -> bool: ...
+    def hash(self) -> int: ...
+    def __ge__(self, other: 'AbstractState') -> bool: ...
+    def __le__(self, other: 'AbstractState') -> bool: ...
     def joinWith(self, other: 'AbstractState') -> None: ...
     def meetWith(self, other: 'AbstractState') -> None: ...
     def widening(self, other: 'AbstractState') -> 'AbstractState': ...
     def narrowing(self, other: 'AbstractState') -> 'AbstractState': ...
     def bottom(self) -> None: ...
+    def sliceState(self, ids: Set[int]) -> 'AbstractState': ...
     def getIDFromAddr(self, addr: int) -> int: ...
     def top(self) -> None: ...
     def getElementIndex(self, gep: 'GepStmt') -> IntervalValue: ...
@@ -1905,12 +1954,25 @@ class AbstractState:
 
     def inVarToValTable(self, var_id: int) -> bool: ...
     def inVarToAddrsTable(self, var_id: int) -> bool: ...
+    @overload
     def getGepObjAddrs(self, var_id: int, offset: IntervalValue) -> AddressValue: ...
+    @overload
+    def getGepObjAddrs(self, var_id: int, offset: int) -> AddressValue: ...
 
     def clear(self) -> None: ...
     def clone(self) -> 'AbstractState': ...
+    def __copy__(self) -> 'AbstractState': ...
+    def __deepcopy__(self, memo: dict) -> 'AbstractState': ...
     def getLocToVal(self) -> dict: ...
     def getVarToVal(self) -> dict: ...
+    def getVarIDs(self) -> Set[int]: ...
+    def getLocIDs(self) -> Set[int]: ...
+    def getVarAddrSets(self) -> Dict[int, FrozenSet[int]]: ...
+    def setVarInterval(self, varId: int, lb: int, ub: int) -> None: ...
+    # (ids, lbs, ubs) for interval-only entries; MIXED entries are skipped
+    def getVarIntervalBounds(self) -> Tuple[List[int], List[int], List[int]]: ...
+    # overwrites only the interval part of each entry, keeping any addresses
+    def setVarIntervalBounds(self, ids: List[int], lbs: List[int], ubs: List[int]) -> None: ...
     def printAbstractState(self) -> None: ...
     def __str__(self) -> str: ...
 
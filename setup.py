@@ -13,10 +13,38 @@ if 'VERSION' not in os.environ:
     os.environ['VERSION'] = '0.0.0'
 version = os.environ['VERSION']
 
+def link_file(src, dst):
+    """Hard-link src to dst, falling back to a copy (e.g. across filesystems).
+    An existing dst is replaced, as copytree(dirs_exist_ok=True) would."""
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def link_tree(src, dst):
+    """Mirror the directory tree src into dst using link_file for every file."""
+    for root, _, files in os.walk(src, followlinks=True):
+        dst_root = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(dst_root, exist_ok=True)
+        for name in files:
+            link_file(os.path.join(root, name), os.path.join(dst_root, name))
+
+
 class CMakeBuild(build_ext):
     def run(self):
         cmake_dir = os.path.abspath(os.path.dirname(__file__))
-        build_temp = os.path.abspath(self.build_temp)
+        # use a stable build dir (not self.build_temp, which varies per install)
+        # so the CMake cache and object files survive between builds; it is
+        # keyed on the interpreter, and an explicit --build-temp still wins
+        if (self.distribution.get_option_dict("build_ext").get("build_temp") or
+                self.distribution.get_option_dict("build").get("build_temp")):
+            build_temp = os.path.abspath(self.build_temp)
+        else:
+            ext_tag = os.path.splitext(sysconfig.get_config_var("EXT_SUFFIX"))[0]
+            build_temp = os.path.join(cmake_dir, "build", "cmake" + ext_tag)
         os.makedirs(build_temp, exist_ok=True)
 
         # get SVF_DIR, LLVM_DIR, Z3_DIR from env, otherwise abort
@@ -49,20 +77,44 @@ class CMakeBuild(build_ext):
         else:
             CMAKE_BUILD_TYPE = os.environ["CMAKE_BUILD_TYPE"]
 
+        # prefer Ninja and ccache when available for fast incremental rebuilds;
+        # both are only chosen on a fresh cache, since an existing cache keeps
+        # the generator and launcher it was configured with
+        cmake_cache = os.path.join(build_temp, "CMakeCache.txt")
+        cmake_generator = []
+        cmake_launcher = []
+        if not os.path.exists(cmake_cache):
+            if shutil.which("ninja"):
+                cmake_generator = ["-G", "Ninja"]
+            else:
+                cmake_generator = ["-G", "Unix Makefiles"]
+            if shutil.which("ccache"):
+                cmake_launcher = [
+                    "-DCMAKE_C_COMPILER_LAUNCHER=ccache",
+                    "-DCMAKE_CXX_COMPILER_LAUNCHER=ccache",
+                ]
+        elif not shutil.which("ccache"):
+            # clear a cached ccache launcher once ccache has been uninstalled
+            cmake_launcher = [
+                "-DCMAKE_C_COMPILER_LAUNCHER=",
+                "-DCMAKE_CXX_COMPILER_LAUNCHER=",
+            ]
+
         # Run CMake
         subprocess.run(
             [
                 "cmake", cmake_dir,
-                "-G", "Unix Makefiles",
+                *cmake_generator,
                 "-DCMAKE_BUILD_TYPE=Release",
                 "-DLLVM_DIR="+LLVM_DIR,
                 "-DSVF_DIR="+SVF_DIR,
                 "-DZ3_DIR="+Z3_DIR,
-                "-DCMAKE_BUILD_WITH_INSTALL_RPATH=ON"
+                "-DCMAKE_BUILD_WITH_INSTALL_RPATH=ON",
                 "-DCMAKE_PREFIX_PATH="+os.environ["PYBIND11_DIR"],
                 "-Dpybind11_DIR="+os.environ["PYBIND11_DIR"],
                 "-DCMAKE_BUILD_TYPE=" + CMAKE_BUILD_TYPE,
                 "-DPython3_EXECUTABLE=" + sys.executable,
+                *cmake_launcher,
                 ],
             cwd=build_temp,
             check=True
@@ -113,27 +165,27 @@ class CMakeBuild(build_ext):
         # cp -rf $GITHUB_WORKSPACE/svf-llvm/include SVF-${osVersion}/Release-build/
         # cp -rf $GITHUB_WORKSPACE/Release-build/lib SVF-${osVersion}/Release-build/
         # cp -rf $GITHUB_WORKSPACE/Release-build/bin SVF-${osVersion}/Release-build/
-        shutil.copytree(os.path.join(SVF_DIR, CMAKE_BUILD_TYPE+"-build", "include"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "include"),dirs_exist_ok=True)
+        link_tree(os.path.join(SVF_DIR, CMAKE_BUILD_TYPE+"-build", "include"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "include"))
         if os.path.exists(os.path.join(SVF_DIR, "svf", "include")):
-            shutil.copytree(os.path.join(SVF_DIR, "svf", "include"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "include"),dirs_exist_ok=True)
+            link_tree(os.path.join(SVF_DIR, "svf", "include"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "include"))
         if os.path.exists(os.path.join(SVF_DIR, "svf-llvm", "include")):
-            shutil.copytree(os.path.join(SVF_DIR, "svf-llvm", "include"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "include"),dirs_exist_ok=True)
-        shutil.copytree(os.path.join(SVF_DIR, CMAKE_BUILD_TYPE+"-build", "lib"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "lib"),dirs_exist_ok=True)
-        shutil.copytree(os.path.join(SVF_DIR, CMAKE_BUILD_TYPE+"-build", "bin"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "bin"),dirs_exist_ok=True)
+            link_tree(os.path.join(SVF_DIR, "svf-llvm", "include"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "include"))
+        link_tree(os.path.join(SVF_DIR, CMAKE_BUILD_TYPE+"-build", "lib"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "lib"))
+        link_tree(os.path.join(SVF_DIR, CMAKE_BUILD_TYPE+"-build", "bin"), os.path.join(self.build_lib, "pysvf", "SVF", "Release-build", "bin"))
 
         # cp -rf $GITHUB_WORKSPACE/z3/bin .build_lib/pysvf/z3/bin
         # if exist bin or lib
         if os.path.exists(os.path.join(os.environ["Z3_DIR"], "bin")):
-            shutil.copytree(os.path.join(os.environ["Z3_DIR"], "bin"), os.path.join(self.build_lib, "pysvf", "SVF", "z3.obj", "bin"),dirs_exist_ok=True)
+            link_tree(os.path.join(os.environ["Z3_DIR"], "bin"), os.path.join(self.build_lib, "pysvf", "SVF", "z3.obj", "bin"))
         if os.path.exists(os.path.join(os.environ["Z3_DIR"], "lib")):
-            shutil.copytree(os.path.join(os.environ["Z3_DIR"], "lib"), os.path.join(self.build_lib, "pysvf", "SVF", "z3.obj", "lib"),dirs_exist_ok=True)
+            link_tree(os.path.join(os.environ["Z3_DIR"], "lib"), os.path.join(self.build_lib, "pysvf", "SVF", "z3.obj", "lib"))
 
         # if exist  $LLVM_DIR/lib/libLLVM.so or libLLVM.dylib
         os.makedirs(os.path.join(self.build_lib, "pysvf", "SVF", "llvm-16.0.0.obj", "lib"), exist_ok=True)
         if os.path.exists(os.path.join(os.environ["LLVM_DIR"], "lib", "libLLVM.so")):
-            shutil.copyfile(os.path.join(os.environ["LLVM_DIR"], "lib", "libLLVM.so"), os.path.join(self.build_lib, "pysvf", "SVF", "llvm-16.0.0.obj", "lib", "libLLVM.so"))
+            link_file(os.path.join(os.environ["LLVM_DIR"], "lib", "libLLVM.so"), os.path.join(self.build_lib, "pysvf", "SVF", "llvm-16.0.0.obj", "lib", "libLLVM.so"))
         if os.path.exists(os.path.join(os.environ["LLVM_DIR"], "lib", "libLLVM.dylib")):
-            shutil.copyfile(os.path.join(os.environ["LLVM_DIR"], "lib", "libLLVM.dylib"), os.path.join(self.build_lib, "pysvf", "SVF", "llvm-16.0.0.obj", "lib", "libLLVM.dylib"))
+            link_file(os.path.join(os.environ["LLVM_DIR"], "lib", "libLLVM.dylib"), os.path.join(self.build_lib, "pysvf", "SVF", "llvm-16.0.0.obj", "lib", "libLLVM.dylib"))
 
 
 setup(